@@ -1,5 +1,5 @@
 """FastAPI ChromaticBot Backend Main Application"""
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 from os import environ
@@ -25,6 +25,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[chromatic.PARTIAL_HEADER, "Retry-After"],
 )
 
 # Include routers
@@ -36,6 +37,7 @@ app.include_router(health.router)
 @app.post("/get_albums_by_chromaticity", response_model=list[AlbumChromaticInfo])
 async def legacy_get_albums_by_chromaticity(
     request: ChromaticityRequest,
+    response: Response,
     database: MusicDatabase = Depends(get_database)
 ) -> list[AlbumChromaticInfo]:
     """Legacy endpoint for backward compatibility
@@ -44,9 +46,9 @@ async def legacy_get_albums_by_chromaticity(
     New clients should use /chromatic/albums instead.
 
     Raises:
-        HTTPException: If Spotify API fails or token is invalid
+        HTTPException: If Spotify API fails, token is invalid or server is busy
     """
-    return await chromatic._get_albums_by_chromaticity_logic(request, database)
+    return await chromatic._get_albums_by_chromaticity_logic(request, database, response)
 
 # Log MongoDB configuration on startup
 @app.on_event("startup")
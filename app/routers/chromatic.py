@@ -1,6 +1,8 @@
 """Chromatic endpoints router"""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 from app.models.schemas import ChromaticityRequest, AlbumChromaticInfo
+from app.services.admission import Deadline, DeadlineExceeded, get_admission_controller, get_request_deadline
 from app.services.database import MusicDatabase, get_database
 from app.services.spotify_api import SpotifyAPIService
 from app.services.chromatic_logic import ChromaticService
@@ -10,38 +12,86 @@ router = APIRouter(
     tags=["chromatic"]
 )
 
+# Response header set when the deadline expired and only cached albums were returned
+PARTIAL_HEADER = "X-Chromatic-Partial"
 
-async def _get_albums_by_chromaticity_logic(
+
+def _retrieve_chromatic_albums(
     request: ChromaticityRequest,
-    database: MusicDatabase
-) -> list[AlbumChromaticInfo]:
-    """Internal logic for getting albums by chromaticity
+    database: MusicDatabase,
+    deadline: Deadline
+) -> tuple[list[AlbumChromaticInfo], bool]:
+    """Blocking Spotify and chromatic analysis work, run off the event loop
 
     Args:
         request: Request containing Spotify token, time revision, and quantity
         database: Database dependency injection
+        deadline: Overall deadline for the request
 
     Returns:
-        List of albums with chromatic information sorted by colorfulness
+        Tuple of (albums sorted by colorfulness, whether the result is partial)
 
     Raises:
-        HTTPException: If Spotify API fails or token is invalid
+        HTTPException: If Spotify API fails, token is invalid or deadline expired
     """
+    # Get top tracks from Spotify
     try:
-        # Get top tracks from Spotify
         spotify_service = SpotifyAPIService()
         top_tracks = spotify_service.get_top_tracks(
             access_token=request.token,
             time_revision=request.timeRevision,
-            quantity_songs=request.quantitySongs
+            quantity_songs=request.quantitySongs,
+            timeout=deadline.timeout(10)
         )
+    except (HTTPException, DeadlineExceeded):
+        # Report our own deadline as load shedding, not as a Spotify outage
+        if deadline.expired():
+            raise get_admission_controller().overloaded(
+                "Request deadline expired before albums could be retrieved"
+            )
+        raise
 
-        # Process chromatic information
-        chromatic_service = ChromaticService(database)
-        chromatic_data = chromatic_service.retrieve_chromatic_order_from_spotify_data(
-            top_tracks,
-            sort_mode=request.sort_mode
-        )
+    # Process chromatic information
+    chromatic_service = ChromaticService(database)
+    return chromatic_service.retrieve_chromatic_order_from_spotify_data(
+        top_tracks,
+        sort_mode=request.sort_mode,
+        deadline=deadline
+    )
+
+
+async def _get_albums_by_chromaticity_logic(
+    request: ChromaticityRequest,
+    database: MusicDatabase,
+    response: Response
+) -> list[AlbumChromaticInfo]:
+    """Internal logic for getting albums by chromaticity
+
+    Requests wait in a bounded per-worker queue for an analysis slot and share
+    one overall deadline. If the deadline expires mid-analysis, only cached
+    albums are returned and the X-Chromatic-Partial header is set.
+
+    Args:
+        request: Request containing Spotify token, time revision, and quantity
+        database: Database dependency injection
+        response: Response used to flag partial results
+
+    Returns:
+        List of albums with chromatic information sorted by colorfulness
+
+    Raises:
+        HTTPException: If Spotify API fails, token is invalid or server is busy
+    """
+    deadline = get_request_deadline()
+
+    try:
+        async with get_admission_controller().admit(deadline):
+            chromatic_data, partial = await run_in_threadpool(
+                _retrieve_chromatic_albums, request, database, deadline
+            )
+
+        if partial:
+            response.headers[PARTIAL_HEADER] = "true"
 
         return chromatic_data
 
@@ -59,18 +109,20 @@ async def _get_albums_by_chromaticity_logic(
 @router.post("/albums", response_model=list[AlbumChromaticInfo])
 async def get_albums_by_chromaticity(
     request: ChromaticityRequest,
+    response: Response,
     database: MusicDatabase = Depends(get_database)
 ) -> list[AlbumChromaticInfo]:
     """Get albums sorted by chromaticity from user's top tracks
 
     Args:
         request: Request containing Spotify token, time revision, and quantity
+        response: Response used to flag partial results
         database: Database dependency injection
 
     Returns:
         List of albums with chromatic information sorted by colorfulness
 
     Raises:
-        HTTPException: If Spotify API fails or token is invalid
+        HTTPException: If Spotify API fails, token is invalid or server is busy
     """
-    return await _get_albums_by_chromaticity_logic(request, database)
+    return await _get_albums_by_chromaticity_logic(request, database, response)
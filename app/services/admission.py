@@ -0,0 +1,156 @@
+"""Admission control and request deadlines for chromatic analysis"""
+from asyncio import Semaphore, wait_for
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from os import environ
+from time import monotonic
+from typing import AsyncIterator
+from fastapi import HTTPException
+
+
+DEFAULT_MAX_CONCURRENT = 2
+DEFAULT_MAX_QUEUE = 8
+DEFAULT_DEADLINE_SECONDS = 25.0
+DEFAULT_RETRY_AFTER_SECONDS = 5
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a request runs out of its overall time budget"""
+
+
+class Deadline:
+    """Overall time budget shared by every step of a single request"""
+
+    def __init__(self, seconds: float):
+        """Start the deadline clock
+
+        Args:
+            seconds: Time budget in seconds from now
+        """
+        self.expires_at = monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Get the remaining time budget
+
+        Returns:
+            Seconds left before the deadline, never negative
+        """
+        return max(0.0, self.expires_at - monotonic())
+
+    def expired(self) -> bool:
+        """Check whether the deadline has passed
+
+        Returns:
+            True if no time budget is left
+        """
+        return self.remaining() <= 0.0
+
+    def check(self) -> None:
+        """Ensure the deadline has not passed
+
+        Raises:
+            DeadlineExceeded: If no time budget is left
+        """
+        if self.expired():
+            raise DeadlineExceeded()
+
+    def timeout(self, cap: float | None = None) -> float:
+        """Get a network timeout that does not outlive the deadline
+
+        Args:
+            cap: Optional maximum timeout for the individual operation
+
+        Returns:
+            The smaller of cap and the remaining time budget, always positive
+
+        Raises:
+            DeadlineExceeded: If no time budget is left
+        """
+        remaining = self.remaining()
+        if remaining <= 0.0:
+            raise DeadlineExceeded()
+        return remaining if cap is None else min(cap, remaining)
+
+
+class AdmissionController:
+    """Bounded queue of concurrent analysis requests for this worker"""
+
+    def __init__(self, max_concurrent: int, max_queue: int, retry_after: int):
+        """Initialize admission controller
+
+        Args:
+            max_concurrent: Number of requests analysed at the same time
+            max_queue: Number of admitted requests allowed to wait for a slot
+            retry_after: Seconds suggested to shed clients via Retry-After
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._semaphore = Semaphore(max_concurrent)
+        self._pending = 0
+
+    def overloaded(self, detail: str) -> HTTPException:
+        """Build the load shedding error returned to clients
+
+        Args:
+            detail: Reason the request was shed
+
+        Returns:
+            HTTPException with status 503 and a Retry-After header
+        """
+        return HTTPException(
+            status_code=503,
+            detail=detail,
+            headers={"Retry-After": str(self.retry_after)}
+        )
+
+    @asynccontextmanager
+    async def admit(self, deadline: Deadline) -> AsyncIterator[None]:
+        """Hold an analysis slot, waiting in the queue if necessary
+
+        Args:
+            deadline: Overall deadline of the request, bounds the queue wait
+
+        Raises:
+            HTTPException: 503 with Retry-After if the queue is full or the
+                deadline expires while waiting for a slot
+        """
+        if self._pending >= self.max_concurrent + self.max_queue:
+            raise self.overloaded("Server is busy analysing other requests, try again later")
+
+        self._pending += 1
+        try:
+            try:
+                await wait_for(self._semaphore.acquire(), deadline.remaining())
+            except TimeoutError:
+                raise self.overloaded("Request deadline expired while waiting for an analysis slot")
+
+            try:
+                yield
+            finally:
+                self._semaphore.release()
+        finally:
+            self._pending -= 1
+
+
+@lru_cache(maxsize=1)
+def get_admission_controller() -> AdmissionController:
+    """Get the per-worker admission controller
+
+    Returns:
+        AdmissionController configured from environment variables
+    """
+    return AdmissionController(
+        max_concurrent=int(environ.get("ALBUMS_MAX_CONCURRENT", DEFAULT_MAX_CONCURRENT)),
+        max_queue=int(environ.get("ALBUMS_MAX_QUEUE", DEFAULT_MAX_QUEUE)),
+        retry_after=int(environ.get("ALBUMS_RETRY_AFTER_SECONDS", DEFAULT_RETRY_AFTER_SECONDS))
+    )
+
+
+def get_request_deadline() -> Deadline:
+    """Start the overall deadline for a new request
+
+    Returns:
+        Deadline configured from environment variables
+    """
+    return Deadline(float(environ.get("ALBUMS_DEADLINE_SECONDS", DEFAULT_DEADLINE_SECONDS)))
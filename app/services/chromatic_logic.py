@@ -4,7 +4,14 @@ from colorthief import ColorThief
 from colorsys import rgb_to_hsv
 from io import BytesIO
 import requests
+from urllib3.exceptions import HTTPError as URLLibHTTPError
+from pymongo.errors import PyMongoError
 from app.services.database import MusicDatabase
+from app.services.admission import Deadline, DeadlineExceeded
+
+
+IMAGE_DOWNLOAD_TIMEOUT = 10
+IMAGE_CHUNK_SIZE = 16 * 1024
 
 
 class ChromaticService:
@@ -33,6 +40,58 @@ class ChromaticService:
         dominant = color_thief.get_color(quality=7)
         return (palette, dominant)
 
+    @staticmethod
+    def download_image(image_url: str, deadline: Deadline | None = None) -> BytesIO:
+        """Download an image in memory (stateless - no disk I/O)
+
+        The body is read as soon as each piece arrives so the deadline bounds
+        the whole download, not only the connect step and each socket read.
+
+        Args:
+            image_url: URL of the image
+            deadline: Optional overall deadline for the download
+
+        Returns:
+            BytesIO with the image content
+
+        Raises:
+            DeadlineExceeded: If the deadline expires before the download ends
+        """
+        if deadline is None:
+            response = requests.get(image_url, timeout=IMAGE_DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+            return BytesIO(response.content)
+
+        try:
+            with requests.get(image_url, timeout=deadline.timeout(IMAGE_DOWNLOAD_TIMEOUT), stream=True) as response:
+                response.raise_for_status()
+                image_bytes = BytesIO()
+                while chunk := response.raw.read1(IMAGE_CHUNK_SIZE, decode_content=True):
+                    deadline.check()
+                    image_bytes.write(chunk)
+        except (requests.RequestException, URLLibHTTPError):
+            if not deadline.expired():
+                raise
+            raise DeadlineExceeded()
+
+        image_bytes.seek(0)
+        return image_bytes
+
+    @staticmethod
+    def _database_timeout(deadline: Deadline | None) -> float | None:
+        """Get the time limit for a cache query
+
+        Args:
+            deadline: Optional overall deadline of the request
+
+        Returns:
+            Remaining time budget, or None for no limit
+
+        Raises:
+            DeadlineExceeded: If no time budget is left
+        """
+        return None if deadline is None else deadline.timeout()
+
     @staticmethod
     def histogram_similarity(hist1: ndarray, hist2: ndarray) -> float:
         """Calculate Bhattacharyya distance between two histograms
@@ -155,40 +214,63 @@ class ChromaticService:
         else:
             return "unknown"
 
-    def retrieve_chromatic_order_from_spotify_data(self, spotify_data: dict[str, any], sort_mode: str = "hue") -> list[dict[str, any]]:
+    def retrieve_chromatic_order_from_spotify_data(self, spotify_data: dict[str, any], sort_mode: str = "hue", deadline: Deadline | None = None) -> tuple[list[dict[str, any]], bool]:
         """Process Spotify data and return albums sorted by chromatic order
 
+        Once the deadline expires, albums that are not cached yet are left out
+        of the result instead of being analysed.
+
         Args:
             spotify_data: Spotify API response with user's top tracks
             sort_mode: Sorting mode - "hue", "saturation", or "brightness"
+            deadline: Optional overall deadline for downloads and extraction
 
         Returns:
-            List of albums with chromatic information, sorted by specified mode
+            Tuple of (albums with chromatic information sorted by specified
+            mode, whether albums were left out because the deadline expired)
         """
         new_items = []
         album_position_map = {}
+        skipped_albums = set()
+
+        # Look up every album in the cache with one query bounded by the deadline
+        album_ids = list(dict.fromkeys(item["album"]["id"] for item in spotify_data["items"]))
+        try:
+            cached_albums = self.database.get_documents_by_ids(album_ids, timeout=self._database_timeout(deadline))
+        except DeadlineExceeded:
+            return new_items, True
+        except PyMongoError as error:
+            if deadline is None or not error.timeout:
+                raise
+            return new_items, True
 
         for item in spotify_data["items"]:
             album_id = item["album"]["id"]
             position = -1
 
+            # Album was dropped because the deadline expired
+            if album_id in skipped_albums:
+                continue
+
             # Check if album already processed
             if album_id in album_position_map:
                 position = album_position_map[album_id]
-            else:
-                album_position_map[album_id] = len(new_items)
 
             if position == -1:
                 # Try to get from cache
-                chromatic_info = self.database.get_document_by_id(album_id)
+                chromatic_info = cached_albums.get(album_id)
                 new_item = {}
                 image_url = item["album"]["images"][0]["url"]
 
                 if chromatic_info is None:
-                    # Download image in memory (stateless - no disk I/O)
-                    response = requests.get(image_url, timeout=10)
-                    response.raise_for_status()
-                    image_bytes = BytesIO(response.content)
+                    try:
+                        image_bytes = self.download_image(image_url, deadline)
+                        # Skip extraction if the download used up the time budget
+                        if deadline is not None:
+                            deadline.check()
+                    except DeadlineExceeded:
+                        skipped_albums.add(album_id)
+                        continue
 
                     # Extract colors from image (no cache available)
                     palette, dominant = self.extract_color_palette_and_dominant(image_bytes)
@@ -199,8 +281,14 @@ class ChromaticService:
                     saturation = s    # Saturation
                     brightness = v    # Brightness (Value)
 
-                    # Save to database cache
-                    self.database.create_document(album_id, dominant, palette, colorfulness)
+                    # Save to database cache, skipped if the deadline is too close
+                    try:
+                        self.database.create_document(album_id, dominant, palette, colorfulness, timeout=self._database_timeout(deadline))
+                    except DeadlineExceeded:
+                        pass
+                    except PyMongoError as error:
+                        if deadline is None or not error.timeout:
+                            raise
                 else:
                     # Use cached chromatic info
                     palette = chromatic_info["palette_colors"]
@@ -220,6 +308,7 @@ class ChromaticService:
                 new_item["saturation"] = saturation
                 new_item["brightness"] = brightness
                 new_item["songs"] = []
+                album_position_map[album_id] = len(new_items)
                 new_items.append(new_item)
                 position = album_position_map[album_id]
 
@@ -239,4 +328,4 @@ class ChromaticService:
         else:  # "hue" (default)
             new_items.sort(key=lambda x: x["colorfulness"])
 
-        return new_items
+        return new_items, bool(skipped_albums)
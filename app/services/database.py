@@ -1,5 +1,5 @@
 """MongoDB database service with dependency injection"""
-from pymongo import MongoClient
+from pymongo import MongoClient, timeout as pymongo_timeout
 from pymongo.database import Database
 from pymongo.collection import Collection
 from os import environ
@@ -37,7 +37,7 @@ class MusicDatabase:
             self.db = None
             self.collection = None
 
-    def create_document(self, id_album: str, dominant_color: tuple, palette_colors: list, colorfulness: float) -> str | None:
+    def create_document(self, id_album: str, dominant_color: tuple, palette_colors: list, colorfulness: float, timeout: float | None = None) -> str | None:
         """Create a new document in the collection
 
         Args:
@@ -45,6 +45,7 @@ class MusicDatabase:
             dominant_color: Dominant color RGB tuple
             palette_colors: List of palette colors
             colorfulness: Colorfulness metric
+            timeout: Optional time limit in seconds for the insert
 
         Returns:
             Inserted document ID or None if DB not enabled
@@ -59,7 +60,8 @@ class MusicDatabase:
             "colorfulness": colorfulness
         }
 
-        result = self.collection.insert_one(document)
+        with pymongo_timeout(timeout):
+            result = self.collection.insert_one(document)
         return str(result.inserted_id)
 
     def get_document_by_id(self, id_album: str) -> dict[str, any] | None:
@@ -77,6 +79,23 @@ class MusicDatabase:
         document = self.collection.find_one({"id_album": id_album})
         return document
 
+    def get_documents_by_ids(self, id_albums: list[str], timeout: float | None = None) -> dict[str, dict[str, any]]:
+        """Find the documents of several albums in a single query
+
+        Args:
+            id_albums: Album IDs to search for
+            timeout: Optional time limit in seconds for the query
+
+        Returns:
+            Dict of documents keyed by album ID, empty dict if DB not enabled
+        """
+        if not self.enabled:
+            return {}
+
+        with pymongo_timeout(timeout):
+            documents = list(self.collection.find({"id_album": {"$in": id_albums}}))
+        return {document["id_album"]: document for document in documents}
+
     def get_all_documents(self) -> list[dict[str, any]]:
         """Get all documents from the collection
 
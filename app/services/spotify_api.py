@@ -14,13 +14,14 @@ class SpotifyAPIService:
     """Service for consuming Spotify API"""
 
     @staticmethod
-    def get_top_tracks(access_token: str, time_revision: str, quantity_songs: int) -> dict:
+    def get_top_tracks(access_token: str, time_revision: str, quantity_songs: int, timeout: float = 10) -> dict:
         """Get user's top tracks from Spotify
 
         Args:
             access_token: Spotify access token
             time_revision: Time period ('1m', '6m', or 'a')
             quantity_songs: Number of songs to retrieve
+            timeout: Request timeout in seconds
 
         Returns:
             Dictionary with Spotify API response containing top tracks
@@ -46,7 +47,7 @@ class SpotifyAPIService:
                     "limit": quantity_songs,
                     "time_range": TIME_RANGES[time_revision]
                 },
-                timeout=10
+                timeout=timeout
             )
 
             if response.status_code == 401: